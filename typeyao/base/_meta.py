@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import inspect
-import json
+import sys
+import types
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from operator import attrgetter, methodcaller
+from typing import TYPE_CHECKING, Any, Callable
 
 from typeyao.base._typing import register_type
 from typeyao.base.exceptions import (
@@ -19,10 +20,34 @@ if TYPE_CHECKING:
     from typeyao.model import Model
 
 
-PROTECTED_MODEL_ATTRIBUTE_NAMES = {
-    "__fields_map__",
-    "__cache__",
-}
+# interned, so membership tests on attribute names can match on identity
+PROTECTED_MODEL_ATTRIBUTE_NAMES = frozenset(
+    sys.intern(name)
+    for name in (
+        "__fields_map__",
+        "__fields_tuple__",
+        "__field_names__",
+        "__instance_field_names__",
+        "__class_field_names__",
+        "__unique_field_names__",
+        "__index_field_names__",
+        "__init_fields_with_defaults__",
+        "__init_fields_with_factories__",
+        "__init_fields_with_setters__",
+        "__init_required_fields__",
+        "__init_allowed__",
+        "__cache__",
+    )
+)
+
+# class attributes of these types are never turned into fields
+NON_FIELD_ATTRIBUTE_TYPES = (
+    types.FunctionType,
+    types.MethodType,
+    classmethod,
+    staticmethod,
+    property,
+)
 
 
 class ModelFieldMap(dict[str, FieldInfo]):
@@ -38,30 +63,25 @@ class ModelFieldMap(dict[str, FieldInfo]):
             if name not in namespace and not name.startswith("_"):
                 fields_map[name] = FieldInfo(name=name, type=annotation)
 
-        field_names = [
-            name
-            for name, value in namespace.items()
-            # skip private attributes
-            if not (name.startswith("_") and not isinstance(value, FieldInfo))
-            # skip classmethods and functions
-            and not (
-                inspect.isfunction(value)
-                or inspect.ismethod(value)
-                or isinstance(value, classmethod)
-            )
-            # skip properties
-            and not isinstance(value, property)
-        ]
-
-        for name in field_names:
-            value = namespace.pop(name)
+        # build the fields in one pass, then drop them from the class namespace
+        field_names = []
+        for name, value in namespace.items():
             if not isinstance(value, FieldInfo):
+                # skip private attributes, functions, methods and properties
+                if name[:1] == "_" or isinstance(
+                    value, NON_FIELD_ATTRIBUTE_TYPES
+                ):
+                    continue
                 value = FieldInfo(
                     name=name,
                     default=value,
                     type=annotations.get(name, MISSING),
                 )
             fields_map[name] = value
+            field_names.append(name)
+
+        for name in field_names:
+            del namespace[name]
         return fields_map
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -71,6 +91,7 @@ class ModelFieldMap(dict[str, FieldInfo]):
             )
         if not isinstance(key, str):
             raise TypeError(f"{self.__class__.__name__} keys must be strings.")
+        key = sys.intern(key)
         if value.primary_key:
             if self.pk:
                 raise InvalidModelError(
@@ -88,6 +109,17 @@ class ModelFieldMap(dict[str, FieldInfo]):
 
 class ModelMeta(type):
     __fields_map__: ModelFieldMap
+    __fields_tuple__: tuple[tuple[str, FieldInfo], ...]
+    __field_names__: frozenset[str]
+    __instance_field_names__: tuple[str, ...]
+    __class_field_names__: frozenset[str]
+    __unique_field_names__: frozenset[str]
+    __index_field_names__: frozenset[str]
+    __init_fields_with_defaults__: tuple[tuple[str, Any], ...]
+    __init_fields_with_factories__: tuple[tuple[str, Callable[[], Any]], ...]
+    __init_fields_with_setters__: tuple[tuple[str, Callable[[Model], Any]], ...]
+    __init_required_fields__: frozenset[str]
+    __init_allowed__: frozenset[str]
 
     def __new__(
         mcs,
@@ -101,6 +133,10 @@ class ModelMeta(type):
         namespace = mcs._namespace_constructor(namespace, bases)
         namespace["_is_abstract"] = abstract
         cls: type["Model"] = super().__new__(mcs, class_name, bases, namespace)  # type: ignore  # noqa: E501
+        mcs._set_field_collections(cls)
+        mcs._set_init_field_partitions(cls)
+        mcs._set_init_defaults_method(cls)
+        mcs._set_class_field_values(cls)
         cls.__cache__ = ModelCache(cls)
         register_type(cls)
         return cls
@@ -116,26 +152,182 @@ class ModelMeta(type):
         if len(bases) > 0 and class_name == "Model":
             errors[class_name] = "'Model' is a protected class name."
         if errors:
+            import json
+
             raise InvalidModelError(json.dumps(errors, indent=4))
 
+    @staticmethod
+    def _set_field_collections(cls: type["Model"]) -> None:
+        fields_map = cls.__fields_map__
+        # (name, field) pairs, for loops that walk every field
+        cls.__fields_tuple__ = tuple(fields_map.items())
+        cls.__field_names__ = frozenset(fields_map)
+        cls.__instance_field_names__ = tuple(
+            name for name, field in fields_map.items() if not field.classfield
+        )
+        cls.__class_field_names__ = frozenset(
+            name for name, field in fields_map.items() if field.classfield
+        )
+        cls.__unique_field_names__ = frozenset(
+            name for name, field in fields_map.items() if field.unique
+        )
+        cls.__index_field_names__ = frozenset(
+            name for name, field in fields_map.items() if field.index
+        )
+
+    @staticmethod
+    def _set_init_field_partitions(cls: type["Model"]) -> None:
+        """Sort instance fields by how Model.__init_defaults__ fills them in."""
+        with_defaults = []
+        with_factories = []
+        with_setters = []
+        required = []
+        init_allowed = []
+        for name, field in cls.__fields_tuple__:
+            if field.classfield:
+                continue
+            if field.init:
+                init_allowed.append(name)
+            setter_name = f"set_{name}"
+            # classify the raw attribute: getattr would unwrap a staticmethod
+            # into a plain function that can't be called as setter(self)
+            setter = next(
+                (
+                    klass.__dict__[setter_name]
+                    for klass in cls.__mro__
+                    if setter_name in klass.__dict__
+                ),
+                None,
+            )
+            if setter is not None:
+                if not isinstance(setter, types.FunctionType):
+                    # e.g. a classmethod: look it up on the instance as usual
+                    setter = methodcaller(setter_name)
+                with_setters.append((name, setter))
+            elif field.default_factory is not MISSING:
+                with_factories.append((name, field.default_factory))
+            elif field.default is not MISSING:
+                with_defaults.append((name, field.default))
+            else:
+                required.append(name)
+        cls.__init_fields_with_defaults__ = tuple(with_defaults)
+        cls.__init_fields_with_factories__ = tuple(with_factories)
+        cls.__init_fields_with_setters__ = tuple(with_setters)
+        cls.__init_required_fields__ = frozenset(required)
+        cls.__init_allowed__ = frozenset(init_allowed)
+
+    @staticmethod
+    def _set_init_defaults_method(cls: type["Model"]) -> None:
+        """Replace the generic __init_defaults__ with one generated for cls.
+
+        The generated method unrolls the loops over cls's field partitions into
+        straight-line code, like dataclasses does for __init__. It is only
+        installed when __init_defaults__ hasn't been overridden by the user.
+        Instances of subclasses (which reach it through super()) are handed
+        off to the generic Model.__init_defaults__, since it only knows cls's
+        fields.
+        """
+        base_model = [k for k in cls.__mro__ if isinstance(k, ModelMeta)][-1]
+        generic_init_defaults = base_model.__dict__["__init_defaults__"]
+        for klass in cls.__mro__:
+            method = klass.__dict__.get("__init_defaults__")
+            if method is not None:
+                break
+        is_generated = getattr(method, "__typeyao_generated__", False)
+        if klass is cls or not (
+            is_generated or method is generic_init_defaults
+        ):
+            return
+
+        globals_: dict[str, Any] = {
+            "cls": cls,
+            "generic_init_defaults": generic_init_defaults,
+            "InvalidModelError": InvalidModelError,
+            "required_fields": cls.__init_required_fields__,
+        }
+        lines = [
+            "def __init_defaults__(self, exclude=None):",
+            "    if type(self) is not cls:",
+            "        return generic_init_defaults(self, exclude)",
+            "    exclude = exclude or set()",
+        ]
+        if cls.__init_required_fields__:
+            lines += [
+                "    missing_fields = required_fields - exclude",
+                "    if missing_fields:",
+                "        missing = ', '.join(map(repr, missing_fields))",
+                "        raise InvalidModelError(f'Missing fields: {missing}')",
+            ]
+        # values are written through FieldInfo.set_value directly, which skips
+        # Model.__setattr__'s name checks but still validates
+        fields_map = cls.__fields_map__
+        for i, (name, default) in enumerate(cls.__init_fields_with_defaults__):
+            globals_[f"set_default_{i}"] = fields_map[name].set_value
+            globals_[f"default_{i}"] = default
+            lines += [
+                f"    if {name!r} not in exclude:",
+                f"        set_default_{i}(self, default_{i})",
+            ]
+        for i, (name, default_factory) in enumerate(
+            cls.__init_fields_with_factories__
+        ):
+            globals_[f"set_factory_default_{i}"] = fields_map[name].set_value
+            globals_[f"default_factory_{i}"] = default_factory
+            lines += [
+                f"    if {name!r} not in exclude:",
+                f"        set_factory_default_{i}(self, default_factory_{i}())",
+            ]
+        for i, (name, setter) in enumerate(cls.__init_fields_with_setters__):
+            globals_[f"set_setter_value_{i}"] = fields_map[name].set_value
+            globals_[f"setter_{i}"] = setter
+            lines += [
+                f"    if {name!r} not in exclude:",
+                f"        set_setter_value_{i}(self, setter_{i}(self))",
+            ]
+
+        namespace: dict[str, Any] = {}
+        exec("\n".join(lines), globals_, namespace)
+        method = namespace["__init_defaults__"]
+        method.__qualname__ = f"{cls.__qualname__}.__init_defaults__"
+        method.__typeyao_generated__ = True
+        cls.__init_defaults__ = method
+
+    @staticmethod
+    def _set_class_field_values(cls: type["Model"]) -> None:
+        # class fields defined on cls are replaced by their values, so reading
+        # them never calls FieldInfo.__get__ (they stay in __fields_map__)
+        for name, field in cls.__fields_tuple__:
+            if field.classfield and field.owner is cls:
+                setattr(cls, name, field.default)
+
     @classmethod
     def _namespace_constructor(
         mcs, namespace: dict[str, Any], bases: tuple[type, ...]
     ) -> dict[str, Any]:
         fields_map = ModelFieldMap.from_namespace(namespace)
         class_fields_map = {}
-        for base in bases:
-            if isinstance(base, ModelMeta):
-                for name, field in base.__fields_map__.items():  # type: ignore
-                    if name not in fields_map:
-                        if field.classfield:  # type: ignore
-                            class_fields_map[name] = field  # type: ignore
-                        else:
-                            fields_map[name] = field.copy()  # type: ignore
-                            namespace["__annotations__"][name] = field.type  # type: ignore # noqa: E501
-        namespace.update(
-            {**fields_map, "__fields_map__": {**fields_map, **class_fields_map}}
-        )
+        # only model bases that actually have fields need to be walked
+        field_bases = [
+            base
+            for base in bases
+            if isinstance(base, ModelMeta) and base.__fields_map__
+        ]
+        if field_bases:
+            annotations = namespace.setdefault("__annotations__", {})
+        for base in field_bases:
+            for name, field in base.__fields_tuple__:
+                if name in fields_map or name in class_fields_map:
+                    continue
+                if field.classfield:
+                    class_fields_map[name] = field
+                else:
+                    fields_map[name] = field.copy()
+                    annotations[name] = field.type
+        namespace.update(fields_map)
+        # inherited class fields are reached through the MRO, so they are only
+        # added to the map (they can't be primary keys, so a plain update is ok)
+        fields_map.update(class_fields_map)
+        namespace["__fields_map__"] = fields_map
         return namespace
 
     @property
@@ -148,7 +340,7 @@ class ModelMeta(type):
 
     @property
     def fields(cls) -> set[FieldInfo]:
-        return set(cls.__fields_map__.values())
+        return {field for _, field in cls.__fields_tuple__}
 
 
 class ModelCache:
@@ -159,6 +351,8 @@ class ModelCache:
         self.model = model
         self._unique_field_cache = UniqueFieldCache(model)
         self._index_field_cache = IndexFieldCache(model)
+        self._has_unique_fields = bool(self._unique_field_cache)
+        self._has_index_fields = bool(self._index_field_cache)
         self.all = set()
 
     def add_model(self, obj: "Model") -> None:
@@ -177,8 +371,8 @@ class ModelCache:
             raise NoPrimaryKeyError(
                 f"{self.model.__name__} does not have a primary key."
             )
-        value = self._unique_field_cache[pk.name].get(pk_value)
-        if not value:
+        value = self._unique_field_cache.get_one(pk.name, pk_value)
+        if value is None:
             raise ModelNotFoundError(
                 f"{self.model.__name__} with {pk.name}={pk_value} not found."
             )
@@ -187,60 +381,61 @@ class ModelCache:
     def filter(
         self, error_if_not_found: bool = True, **kwargs: Any
     ) -> set["Model"]:
-        invalid_kwargs = set(kwargs.keys()) - set(
-            self.model.__fields_map__.keys()
-        )
+        invalid_kwargs = kwargs.keys() - self.model.__field_names__
         if invalid_kwargs:
             raise InvalidFieldError(
                 f"{self.model.__name__} does not have fields named {invalid_kwargs}."
             )
 
         # Unique fields are the fastest to filter by, so filter by them if possible
-        unique_field_kwargs: dict[str, Any] = {}
-        for unique_field_name in self._unique_field_cache:
-            if unique_field_name in kwargs:
-                unique_field_kwargs[unique_field_name] = kwargs.pop(
-                    unique_field_name
+        if self._has_unique_fields:
+            unique_field_names = (
+                kwargs.keys() & self.model.__unique_field_names__
+            )
+            # If there are any unique fields in kwargs, use the unique field cache only
+            if unique_field_names:
+                field_name = unique_field_names.pop()
+                obj = self._unique_field_cache.get_one(
+                    field_name, kwargs[field_name]
                 )
-        # If there are any unique fields in kwargs, use the unique field cache only
-        if unique_field_kwargs:
-            obj = self._unique_field_cache.filter(
-                error_if_not_found, **unique_field_kwargs
-            ).pop()
-            # ensure found object matches all other kwargs
-            for field_name, value in kwargs.items():
-                if getattr(obj, field_name) != value:
+                # ensure found object matches all other kwargs
+                if obj is None or any(
+                    getattr(obj, name) != value
+                    for name, value in kwargs.items()
+                ):
                     if error_if_not_found:
                         raise ModelNotFoundError(
                             f"{self.model.__name__} with values {kwargs} not found."
                         )
                     return set()
-            return {obj}
+                return {obj}
 
         # Otherwise, filter first by index fields (if any), then by other fields (if any)
-        index_field_kwargs: dict[str, Any] = {}
-        for index_field_name in self._index_field_cache:
-            if index_field_name in kwargs:
-                index_field_kwargs[index_field_name] = kwargs.pop(
-                    index_field_name
+        objects = self.all
+        if self._has_index_fields:
+            index_field_kwargs: dict[str, Any] = {
+                name: kwargs.pop(name)
+                for name in kwargs.keys() & self.model.__index_field_names__
+            }
+            if index_field_kwargs:
+                objects = self._index_field_cache.filter(
+                    error_if_not_found, **index_field_kwargs
                 )
-        if index_field_kwargs:
-            objects = self._index_field_cache.filter(
-                error_if_not_found, **index_field_kwargs
-            )
-        else:
-            objects = self.all
 
-        for field_name, value in kwargs.items():
+        if kwargs:
+            # check every remaining predicate in a single pass over the objects
+            filters = tuple(
+                (attrgetter(name), value) for name, value in kwargs.items()
+            )
             objects = {
-                obj for obj in objects if getattr(obj, field_name) == value
+                obj
+                for obj in objects
+                if all(get_value(obj) == value for get_value, value in filters)
             }
-            if not objects:
-                if error_if_not_found:
-                    raise ModelNotFoundError(
-                        f"{self.model.__name__} with values {kwargs} not found."
-                    )
-                break
+            if not objects and error_if_not_found:
+                raise ModelNotFoundError(
+                    f"{self.model.__name__} with values {kwargs} not found."
+                )
         return objects
 
 
@@ -268,19 +463,22 @@ class UniqueFieldCache(dict[str, dict[Any, "Model"]]):
         for field_name, cache in self.items():
             cache[getattr(obj, field_name)] = obj
 
+    def get_one(self, field_name: str, value: Any) -> "Model" | None:
+        return self[field_name].get(value)
+
     def filter(
         self, error_if_not_found: bool = True, **kwargs: Any
     ) -> set["Model"]:
-        invalid_kwargs = set(kwargs.keys()) - set(self.model.field_names)
+        invalid_kwargs = kwargs.keys() - self.model.__field_names__
         if invalid_kwargs:
             raise InvalidFieldError(
                 f"{self.model.__name__} does not have fields named {invalid_kwargs}."
             )
 
-        filters = list(kwargs.items())
-        filter_field_name, filter_value = filters.pop()
-        model = self[filter_field_name].get(filter_value)
-        if not model:
+        filters = iter(kwargs.items())
+        filter_field_name, filter_value = next(filters)
+        model = self.get_one(filter_field_name, filter_value)
+        if model is None:
             if error_if_not_found:
                 raise ModelNotFoundError(
                     f"{self.model.__name__} with values {kwargs} not found."
@@ -296,16 +494,10 @@ class UniqueFieldCache(dict[str, dict[Any, "Model"]]):
         return {model}
 
 
-class IndexFieldCache(dict[str, dict[str, list["Model"]]]):
+class IndexFieldCache(dict[str, dict[Any, set["Model"]]]):
     def __init__(self, model: type["Model"]):
         self.model = model
-        self.update(
-            {
-                f.name: defaultdict(list["Model"])
-                for f in model.fields
-                if f.index
-            }
-        )
+        self.update({f.name: defaultdict(set) for f in model.fields if f.index})
 
     def add_model(self, obj: "Model") -> None:
         if not isinstance(obj, self.model):
@@ -313,30 +505,30 @@ class IndexFieldCache(dict[str, dict[str, list["Model"]]]):
                 f"Can only cache instances of {self.model.__name__}."
             )
         for field_name, cache in self.items():
-            cache[getattr(obj, field_name)].append(obj)
+            cache[getattr(obj, field_name)].add(obj)
 
     def filter(
         self, error_if_not_found: bool = True, **kwargs: Any
     ) -> set["Model"]:
-        invalid_kwargs = set(kwargs.keys()) - set(self.model.field_names)
+        invalid_kwargs = kwargs.keys() - self.model.__field_names__
         if invalid_kwargs:
             raise InvalidFieldError(
                 f"{self.model.__name__} does not have fields named {invalid_kwargs}."
             )
 
-        kwargs_items = list(kwargs.items())
-        filter_field_name, filter_value = kwargs_items.pop()
-        models = self[filter_field_name].get(filter_value, [])
-        while kwargs_items:
-            filter_field_name, filter_value = kwargs_items.pop()
-            models = [
-                m
-                for m in models
-                if getattr(m, filter_field_name) == filter_value
-            ]
+        # Intersect the posting sets smallest first, so each AND is a C-level
+        # set operation over the smallest possible intermediate result
+        posting_sets = sorted(
+            (self[name].get(value, set()) for name, value in kwargs.items()),
+            key=len,
+        )
+        models = set(posting_sets[0])
+        for posting_set in posting_sets[1:]:
+            models &= posting_set
             if not models:
                 if error_if_not_found:
                     raise ModelNotFoundError(
                         f"{self.model.__name__} with values {kwargs} not found."
                     )
-        return set(models)
+                break
+        return models
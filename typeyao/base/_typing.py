@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import types
 from datetime import date, datetime
-from functools import partial
+from functools import lru_cache, partial
 from typing import *  # noqa: F403, F401  # type: ignore
 from typing import GenericAlias  # type: ignore
 from typing import _GenericAlias  # type: ignore
@@ -33,6 +33,8 @@ MISSING = MissingType()
 
 class TypeRegistry(dict[str, type]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # registered types, so membership tests by type don't scan values()
+        self._types: set[type] = set()
         for arg in args:
             self.register(type_=arg)
         for key, value in kwargs.items():
@@ -56,10 +58,62 @@ class TypeRegistry(dict[str, type]):
             return partial(wrap, name=name)
         return wrap(type_=type_, name=name)
 
+    def _sync_types(self) -> None:
+        self._types = set(self.values())
+        # checks that passed or were compiled against removed or replaced
+        # entries are no longer valid
+        _clear_type_caches()
+
+    # every dict mutator is overridden so that _types never goes stale
+
+    def __setitem__(self, __key: str, __value: type) -> None:
+        replaced = super().__contains__(__key)
+        super().__setitem__(__key, __value)
+        if replaced:
+            self._sync_types()
+        else:
+            self._types.add(__value)
+
+    def __delitem__(self, __key: str) -> None:
+        super().__delitem__(__key)
+        self._sync_types()
+
+    def __ior__(self, __other: Any) -> TypeRegistry:
+        super().__ior__(__other)
+        self._sync_types()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._sync_types()
+
+    def setdefault(self, __key: str, __default: Any = None) -> Any:
+        if super().__contains__(__key):
+            return super().__getitem__(__key)
+        self[__key] = __default
+        return __default
+
+    def pop(self, __key: str, *args: Any) -> Any:
+        value = super().pop(__key, *args)
+        self._sync_types()
+        return value
+
+    def popitem(self) -> tuple[str, type]:
+        item = super().popitem()
+        self._sync_types()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._sync_types()
+
     def __contains__(self, __key: object) -> bool:
         if isinstance(__key, str):
             return super().__contains__(__key)
-        return __key in self.values()
+        try:
+            return __key in self._types
+        except TypeError:  # unhashable
+            return False
 
     def __getitem__(self, __key: str) -> type:
         return super().__getitem__(__key)
@@ -150,23 +204,84 @@ def is_alias(type_: Any) -> bool:
     return is_simple_generic_alias(type_) or is_nested_generic_alias(type_)
 
 
+# Both caches below hold strong references to the types they have seen, so
+# they are bounded to keep dynamically defined classes from piling up.
+_TYPE_CACHE_MAXSIZE = 1024
+
+# (value type, annotation) pairs that already passed check_type. Unless value is
+# a class, the outcome only depends on the value's type, and registering more
+# types never turns a pass into a failure, so a pass can be remembered. The set
+# is emptied once it reaches _TYPE_CACHE_MAXSIZE.
+_valid_type_pairs: set[tuple[type, Any]] = set()
+
+
+def _clear_type_caches() -> None:
+    _valid_type_pairs.clear()
+    _cached_type_checker.cache_clear()
+
+
+# A type checker takes (value, raise_on_exception, check_class)
+TypeChecker = Callable[[Any, bool, bool], bool]
+
+
 def check_type(
     value: Any,
     type_: Any,
     raise_on_exception: bool = True,
     check_class: bool = False,
 ) -> bool:
+    # fast path for the common case: a plain, registered class
+    if (
+        type(type_) is type
+        and not check_class
+        and type_ in type_registry._types
+    ):
+        if isinstance(value, type_):
+            return True
+        return _check_registered_type(value, raise_on_exception, False, type_)
+    if check_class or isinstance(value, type):
+        return _get_type_checker(type_)(value, raise_on_exception, check_class)
+    try:
+        type_pair = (type(value), type_)
+        if type_pair in _valid_type_pairs:
+            return True
+    except TypeError:  # unhashable annotation
+        return _get_type_checker(type_)(value, raise_on_exception, check_class)
+    result = _get_type_checker(type_)(value, raise_on_exception, check_class)
+    if result is True:
+        if len(_valid_type_pairs) >= _TYPE_CACHE_MAXSIZE:
+            _valid_type_pairs.clear()
+        _valid_type_pairs.add(type_pair)
+    return result
+
+
+def _get_type_checker(type_: Any) -> TypeChecker:
+    try:
+        return _cached_type_checker(type_)
+    except TypeError:  # unhashable annotation
+        return _compile_type_checker(type_)
+
+
+def _compile_type_checker(type_: Any) -> TypeChecker:
+    """Classify an annotation once and return the checker for its kind."""
     if isinstance(type_, str):
         type_ = get_type_from_string(type_)
 
     if is_optional_type(type_) or is_union_type(type_) or is_Type(type_):
-        check_class = is_Type(type_)
-        return _validate_nested_types(
-            value,
-            type_.__args__,
-            raise_on_exception,
-            check_class=check_class,
-        )
+        nested_types = type_.__args__
+        nested_check_class = is_Type(type_)
+
+        def check_nested_types(
+            value: Any, raise_on_exception: bool, check_class: bool
+        ) -> bool:
+            return _validate_nested_types(
+                value,
+                nested_types,
+                raise_on_exception,
+                check_class=nested_check_class,
+            )
+
+        return check_nested_types
 
     if is_classvar(type_):
         raise InvalidTypeError("Cannot validate type of a ClassVar")
@@ -175,17 +290,42 @@ def check_type(
         assert type_.__origin__ != type, "nah, son"
         type_ = type_.__origin__
 
-    if type_ is None:
-        type_name = type_.__class__.__name__
-    elif type_ in type_registry:
-        type_name = type_.__name__
-    elif is_forward_ref(type_):
-        if type_.__forward_arg__ not in type_registry:
-            raise InvalidTypeError(
-                f"ForwardRef for unknown type '{type_.__forward_arg__}'"
-            )
+    if type_ is None or type_ in type_registry:
+        registered_type = type_registry[
+            type_.__class__.__name__ if type_ is None else type_.__name__
+        ]
+        return partial(_check_registered_type, registered_type=registered_type)
+
+    if is_forward_ref(type_):
         type_name = type_.__forward_arg__
-    else:
+
+        def check_forward_ref(
+            value: Any, raise_on_exception: bool, check_class: bool
+        ) -> bool:
+            if type_name not in type_registry:
+                raise InvalidTypeError(
+                    f"ForwardRef for unknown type '{type_name}'"
+                )
+            return _check_registered_type(
+                value,
+                raise_on_exception,
+                check_class,
+                registered_type=type_registry[type_name],
+            )
+
+        return check_forward_ref
+
+    def check_unknown_type(
+        value: Any, raise_on_exception: bool, check_class: bool
+    ) -> bool:
+        # the type may have been registered since the checker was compiled
+        if type_ in type_registry:
+            return _check_registered_type(
+                value,
+                raise_on_exception,
+                check_class,
+                registered_type=type_registry[type_.__name__],
+            )
         error_message = (
             f"Unknown type {type_}. Got value {value} of type {type(value)}"
         )
@@ -193,7 +333,21 @@ def check_type(
             raise InvalidTypeError(error_message)
         return False
 
-    registered_type = type_registry[type_name]
+    return check_unknown_type
+
+
+# annotation -> type checker specialized for it by _compile_type_checker
+_cached_type_checker = lru_cache(maxsize=_TYPE_CACHE_MAXSIZE)(
+    _compile_type_checker
+)
+
+
+def _check_registered_type(
+    value: Any,
+    raise_on_exception: bool,
+    check_class: bool,
+    registered_type: type,
+) -> bool:
     if check_class:
         try:
             result = issubclass(value, registered_type)
@@ -212,12 +366,21 @@ def check_type(
     return result
 
 
+_type_string_code_cache: dict[str, types.CodeType] = {}
+
+
 def get_type_from_string(type_string: str) -> Any:
-    _locals = locals()
-    _locals.update(type_registry)
-    varname = "type_"
-    exec(f"{varname} = {type_string}", globals(), _locals)
-    return _locals[varname]
+    # bare names of registered types (the usual forward ref) need no eval
+    registered_type = type_registry.get(type_string)
+    if registered_type is not None:
+        return registered_type
+    # compile each type string once; evaluating the cached code object against
+    # the registry keeps late-registered types (forward refs) resolvable
+    code = _type_string_code_cache.get(type_string)
+    if code is None:
+        code = compile(type_string, "<type>", "eval")
+        _type_string_code_cache[type_string] = code
+    return eval(code, globals(), type_registry)
 
 
 if __name__ == "__main__":
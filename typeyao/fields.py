@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import inspect
-import operator
+import os
+import sys
+import types
 import typing
 from collections.abc import Callable, Mapping
-from functools import reduce
 
 from typeyao.base._typing import (
     MISSING,
@@ -15,13 +15,15 @@ from typeyao.base._typing import (
     is_classvar,
     type_registry,
 )
+from typeyao.base.exceptions import InvalidFieldError
 
 if typing.TYPE_CHECKING:
     from typeyao.model import Model
 
-
-class InvalidFieldError(Exception):
-    pass
+# Set TYPEYAO_VALIDATE=0 (or false/no/off) to skip type and choices validation
+# on field writes
+_validate_env = os.environ.get("TYPEYAO_VALIDATE", "1").strip().lower()
+TYPEYAO_VALIDATE = _validate_env not in ("0", "false", "no", "off")
 
 
 def Field(
@@ -70,7 +72,8 @@ class FieldInfo:
         unique: if True, the field must be unique across all instances of the model. Cannot be False if primary_key is
             True.
         index: if True, the field will be a table index for the model.
-        choices: If provided, allowed values for the field.
+        choices: If provided, allowed values for the field (stored as a tuple).
+        classfield: True if the field's type is a ClassVar. Derived from the type.
         repr: if True, the field will be included in the object's repr().
         compare: if True, the field will be used in comparison functions.
         metadata: if specified, must be a mapping which is stored but not otherwise examined by dataclass.
@@ -80,6 +83,25 @@ class FieldInfo:
         InvalidFieldError: if default is set, and unique or primary_key set to True.
     """
 
+    __slots__ = (
+        "name",
+        "type",
+        "default",
+        "default_factory",
+        "const",
+        "init",
+        "primary_key",
+        "unique",
+        "index",
+        "choices",
+        "classfield",
+        "repr",
+        "hash",
+        "compare",
+        "metadata",
+        "owner",
+    )
+
     def __init__(
         self,
         *,
@@ -98,21 +120,21 @@ class FieldInfo:
         compare: bool = True,
         metadata: typing.Optional[Mapping[typing.Any, typing.Any]] = None,
     ) -> None:
-        self.__name = name
-        self.__default = default
-        self.__default_factory = default_factory
-        self.__const = const
-        self.__repr = repr
-        self.__hash = hash
-        self.__compare = compare
-        self.__metadata = metadata or {}
-        self.__primary_key = primary_key
-        self.__unique = (primary_key is True) or unique
-        self.__index = index
-        self.__choices = choices or []
-        self.__type = type if type is not None else None.__class__
-        self.__init = init if init is not None else (not self.classfield)
-        self.__owner: type["Model"] | None = None
+        self.name = name
+        self.default = default
+        self.default_factory = default_factory
+        self.const = const
+        self.repr = repr
+        self.hash = hash
+        self.compare = compare
+        self.metadata = metadata or {}
+        self.primary_key = primary_key
+        self.unique = primary_key is True or unique is True
+        self.index = index is True
+        self.choices = tuple(choices or ())
+        self._set_type(type if type is not None else None.__class__)
+        self.init = init if init is not None else (not self.classfield)
+        self.owner: type["Model"] | None = None
         if default is not MISSING:
             for attr_name in ("default_factory", "unique", "primary_key"):
                 if getattr(self, attr_name) not in (MISSING, False):
@@ -122,107 +144,64 @@ class FieldInfo:
 
     def __repr__(self) -> str:
         return (
-            f"<{self.__class__.__name__} {self.__name} "
+            f"<{self.__class__.__name__} {self.name} "
             f"type={self.type} default={self.default} default_factory={self.default_factory} "
             f"init={self.init} repr={self.repr} hash={self.hash} compare={self.compare} metadata={self.metadata} "
             f"unique={self.unique} index={self.index} choices={self.choices}>"
         )
 
-    @property
-    def owner(self) -> type["Model"] | None:
-        return self.__owner
-
-    @property
-    def name(self) -> str | MissingType[str]:
-        return self.__name
-
-    @property
-    def primary_key(self) -> bool:
-        return self.__primary_key
-
-    @property
-    def type(self) -> type | MissingType:
-        return self.__type
-
-    @property
-    def default(self) -> typing.Any:
-        return self.__default
-
-    @property
-    def default_factory(self) -> Callable[[], typing.Any] | MissingType:
-        return self.__default_factory
-
-    @property
-    def const(self) -> bool:
-        return self.__const
-
-    @property
-    def init(self) -> bool:
-        return self.__init
-
-    @property
-    def repr(self) -> bool:
-        return self.__repr
-
-    @property
-    def hash(self) -> bool:
-        return self.__hash
-
-    @property
-    def compare(self) -> bool:
-        return self.__compare
-
-    @property
-    def metadata(self) -> Mapping[typing.Any, typing.Any]:
-        return self.__metadata
-
-    @property
-    def unique(self) -> bool:
-        return self.__unique is True or self.primary_key is True
-
-    @property
-    def index(self) -> bool:
-        return self.__index is True
-
-    @property
-    def choices(self) -> list[typing.Any]:
-        # return a copy to prevent modification
-        return self.__choices.copy()
-
-    @property
-    def classfield(self) -> bool:
-        return is_classvar(self.type) or (
-            isinstance(self.type, str) and "ClassVar" in self.type
-        )
+    def _set_type(self, type_: typing.Any) -> None:
+        """Set the field's type, along with whether it makes a class field."""
+        self.type = type_
+        if type(type_) is str:
+            self.classfield = "ClassVar" in type_
+        else:
+            self.classfield = is_classvar(type_)
 
     def update_forward_refs(self) -> None:
         """Update forward references on the field's type."""
-        if isinstance(self.type, str):
-            self.__type = get_type_from_string(self.type)
-        elif isinstance(self.type, typing.ForwardRef):
-            self.__type = type_registry[self.type.__forward_arg__]
-
+        field_type = self.type
+        if type(field_type) is str:
+            self._set_type(get_type_from_string(field_type))
+        elif type(field_type) is typing.ForwardRef:
+            self._set_type(type_registry[field_type.__forward_arg__])
+
+    # FieldInfo is a non-data descriptor: once a field is set, its value in the
+    # instance __dict__ shadows the descriptor, so reads never call __get__.
+    # Writes go through Model.__setattr__, which calls set_value. Class fields
+    # are plain class attributes, see ModelMeta._set_class_field_values.
     def __get__(
         self, instance: "Model" | None, owner: type["Model"]
     ) -> typing.Any:
         if instance is None:
-            assert self.owner is owner, f"owner mismatch for {self}"
-            assert self.default is not MISSING, f"no default set for {self}"
-            return self.default
-        if self.classfield:
-            return self.default
-        return instance.__dict__[self.name]  # type: ignore
+            # class access returns the field's default, as it always has; a
+            # field without one returns the FieldInfo itself
+            if self.default is not MISSING:
+                return self.default
+            return self
+        raise AttributeError(
+            f"{owner.__name__!r} object has no value for field {self.name!r}"
+        )
 
-    def __set__(self, instance: "Model", value: typing.Any) -> None:
-        self._validate_value_type(value=value)
+    def set_value(self, instance: "Model", value: typing.Any) -> None:
+        if TYPEYAO_VALIDATE:
+            self._validate_value_type(value=value)
         instance.__dict__[self.name] = value  # type: ignore
 
     def _validate_value_type(self, value: typing.Any) -> None:
-        assert not isinstance(self.type, MissingType), f"type unset for {self}"
-        check_type(value=value, type_=self.type)
-        if self.choices and value not in self.choices:
+        type_ = self.type
+        # scalar fields are the common case: an exact type match settles it
+        # without going through check_type. Anything else (e.g. a bool for an
+        # int field) still gets the full check.
+        if type(value) is not type_ or not (
+            type_ is int or type_ is str or type_ is float or type_ is bool
+        ):
+            assert type(type_) is not MissingType, f"type unset for {self}"
+            check_type(value=value, type_=type_)
+        choices = self.choices
+        if choices and value not in choices:
             raise InvalidTypeError(
-                f"Value must be one of {','.join(map(repr,self.choices))} but value was {value}"
+                f"Value must be one of {','.join(map(repr, choices))} but value was {value}"
             )
 
     def __set_name__(self, owner: type["Model"], name: str) -> None:
@@ -231,20 +210,18 @@ class FieldInfo:
                 f"Field {name!r} on {owner.__name__} has already been set to {self.owner}"
             )
 
-        if self.__name is not MISSING and self.__name != name:
+        if self.name is not MISSING and self.name != name:
             raise InvalidFieldError(
-                f"Field '{name}' has conflicting names: {self.__name} != {name}"
+                f"Field '{name}' has conflicting names: {self.name} != {name}"
             )
 
         annotation = owner.__annotations__.get(name, MISSING)
         if self.type is MISSING:
             if annotation is MISSING:
-                print(owner.__annotations__)
-                breakpoint()
                 raise InvalidFieldError(
                     f"Field {name!r} on {owner.__name__} must specify a type or have a type annotation."
                 )
-            self.__type = annotation
+            self._set_type(annotation)
         elif annotation is not MISSING and self.type != annotation:
             raise InvalidFieldError(
                 f"Field '{name}' has conflicting type annotations: {self.type} != {annotation}"
@@ -255,7 +232,7 @@ class FieldInfo:
             setter_name = f"set_{name}"
             if hasattr(owner, setter_name):
                 try:
-                    self.__default = getattr(owner, setter_name)()
+                    self.default = getattr(owner, setter_name)()
                 except Exception as e:
                     raise InvalidFieldError(
                         f"Error while setting class variable '{name}' via {setter_name}: {e.__class__.__name__}: "
@@ -263,7 +240,7 @@ class FieldInfo:
                     )
             elif not isinstance(self.default_factory, MissingType):
                 try:
-                    self.__default = self.default_factory()
+                    self.default = self.default_factory()
                 except Exception as e:
                     raise InvalidFieldError(
                         f"Error while setting class variable '{name}' via default factory: {e.__class__.__name__}: "
@@ -271,8 +248,9 @@ class FieldInfo:
                     )
         else:
             self._validate_instance_field_defaults(owner, name)
-        self.__name = name
-        self.__owner = owner
+        # interned, so lookups keyed by field name can match on identity
+        self.name = sys.intern(name)
+        self.owner = owner
 
     def copy(self) -> FieldInfo:
         """Return a copy of the field, without the owner and name set."""
@@ -316,8 +294,8 @@ class FieldInfo:
         setter_name = f"set_{name}"
         setter_repr = f"{owner.__name__}.{setter_name}()"  # type: ignore
         setter = getattr(owner, setter_name, MISSING)
-        if setter != MISSING and not (
-            inspect.ismethod(setter) and setter.__self__ is owner
+        if setter is not MISSING and not (
+            isinstance(setter, types.MethodType) and setter.__self__ is owner
         ):
             raise InvalidFieldError(
                 f"'{name}' field is a class attribute, but its setter (i.e {setter_repr}) is not a classmethod"
@@ -329,13 +307,11 @@ class FieldInfo:
     ):
         setter_name = f"set_{name}"
         setter_repr = f"{owner.__name__}.{setter_name}()"
-        default_count = 0
-        if self.default is not MISSING:
-            default_count += 1
-        if self.default_factory is not MISSING:
-            default_count += 1
-        if hasattr(owner, setter_name):
-            default_count += 1
+        default_count = (
+            (self.default is not MISSING)
+            + (self.default_factory is not MISSING)
+            + hasattr(owner, setter_name)
+        )
         if default_count > 1:
             raise InvalidFieldError(
                 f"Field '{name}' must have only one of 'default', 'default_factory', and {setter_repr!r}"
@@ -1,94 +1,106 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, Callable
 
 from typeyao.base._meta import (
     PROTECTED_MODEL_ATTRIBUTE_NAMES,
     ModelCache,
     ModelMeta,
 )
-from typeyao.base._typing import MISSING, InvalidTypeError
+from typeyao.base._typing import InvalidTypeError
 from typeyao.base.exceptions import InvalidModelError
 from typeyao.fields import FieldInfo
 
 
 class Model(metaclass=ModelMeta):
     __fields_map__: dict[str, FieldInfo]
+    __fields_tuple__: tuple[tuple[str, FieldInfo], ...]
+    __field_names__: frozenset[str]
+    __instance_field_names__: tuple[str, ...]
+    __class_field_names__: frozenset[str]
+    __unique_field_names__: frozenset[str]
+    __index_field_names__: frozenset[str]
+    __init_fields_with_defaults__: tuple[tuple[str, Any], ...]
+    __init_fields_with_factories__: tuple[tuple[str, Callable[[], Any]], ...]
+    __init_fields_with_setters__: tuple[tuple[str, Callable[[Model], Any]], ...]
+    __init_required_fields__: frozenset[str]
+    __init_allowed__: frozenset[str]
     __cache__: ModelCache
     _is_abstract: bool
 
     def __init__(self, **kwargs: Any):
-        if self._is_abstract:
+        cls = type(self)
+        if cls._is_abstract:
             raise InvalidModelError(
-                f"Cannot instantiate abstract model: {self.__class__.__name__}"
+                f"Cannot instantiate abstract model: {cls.__name__}"
             )
         self.__init_kwargs__(kwargs)
         self.__init_defaults__(exclude=set(kwargs))
         self.__post_init__()
-        self.__cache__.add_model(self)  # type: ignore
+        cls.__cache__.add_model(self)  # type: ignore
 
     def __init_kwargs__(self, init_kwargs: dict[str, Any]) -> None:
         errors = {}
+        fields_map = self.__fields_map__
+        init_allowed = self.__init_allowed__
         for kw, value in init_kwargs.items():
-            field = self.__fields_map__.get(kw)
-            try:
-                assert (
-                    field is not None
-                ), f"{kw} is not a field in {self.__class__.__name__}."
-                assert (
-                    field.classfield is False
-                ), f"'{field.name}' is a class variable. It can't be overwritten."
-                assert (
-                    field.init is True
-                ), f"'{field.name}' field has init=False"
-                setattr(self, field.name, value)
-            except (AssertionError, InvalidTypeError) as e:
-                errors[kw] = str(e)
+            if kw in init_allowed:
+                try:
+                    # write through the field directly: init_allowed has no
+                    # class fields, so Model.__setattr__ has nothing to check
+                    fields_map[kw].set_value(self, value)
+                except (AssertionError, InvalidTypeError) as e:
+                    errors[kw] = str(e)
+                continue
+            field = fields_map.get(kw)
+            if field is None:
+                errors[kw] = f"{kw} is not a field in {type(self).__name__}."
+            elif field.classfield:
+                errors[
+                    kw
+                ] = f"'{field.name}' is a class variable. It can't be overwritten."
+            else:
+                errors[kw] = f"'{field.name}' field has init=False"
 
         if errors:
+            import json
+
             raise InvalidModelError("\n" + json.dumps(errors, indent=4))
 
-    def __init_defaults__(
-        self, exclude: set[str] | None = None
-    ) -> set[FieldInfo]:
+    def __init_defaults__(self, exclude: set[str] | None = None) -> None:
         exclude = exclude or set()
-        fields = {
-            f
-            for f in self.__fields_map__.values()
-            if f.name not in exclude and not f.classfield
-        }
-        fields_with_setters = {
-            f for f in fields if hasattr(self, f"set_{f.name}")
-        }
-        fields_with_default_factories = {
-            f for f in fields if f.default_factory is not MISSING
-        }
-        fields_with_defaults = {f for f in fields if f.default is not MISSING}
-        missing_fields = (
-            fields
-            - fields_with_setters
-            - fields_with_default_factories
-            - fields_with_defaults
-        )
-        if missing_fields:
-            raise InvalidModelError(
-                f"Missing fields: {', '.join(map(lambda f: repr(f.name), missing_fields))}"
-            )
-        for field in fields_with_defaults:
-            setattr(self, field.name, field.default)
-
-        for field in fields_with_default_factories:
-            setattr(self, field.name, field.default_factory())  # type: ignore
-
-        for field in fields_with_setters:
-            setattr(self, field.name, getattr(self, f"set_{field.name}")())
-        return fields
+        cls = type(self)
+        required_fields = cls.__init_required_fields__
+        if required_fields:
+            missing_fields = required_fields - exclude
+            if missing_fields:
+                raise InvalidModelError(
+                    f"Missing fields: {', '.join(map(repr, missing_fields))}"
+                )
+        fields_map = cls.__fields_map__
+        for name, default in cls.__init_fields_with_defaults__:
+            if name not in exclude:
+                fields_map[name].set_value(self, default)
+
+        for name, default_factory in cls.__init_fields_with_factories__:
+            if name not in exclude:
+                fields_map[name].set_value(self, default_factory())
+
+        for name, setter in cls.__init_fields_with_setters__:
+            if name not in exclude:
+                fields_map[name].set_value(self, setter(self))
 
     def __post_init__(self) -> None:
         pass
 
     def __setattr__(self, __name: str, __value: Any) -> None:
+        field = self.__fields_map__.get(__name)
+        if field is not None:
+            if field.classfield:
+                raise AttributeError(
+                    f"'{__name}' is a class variable. It can't be overwritten."
+                )
+            return field.set_value(self, __value)
         if __name in PROTECTED_MODEL_ATTRIBUTE_NAMES:
             raise AttributeError(
                 f"{__name!r} is a protected attribute of {self.__class__.__name__}"
@@ -98,13 +110,23 @@ class Model(metaclass=ModelMeta):
     @classmethod
     def update_forward_refs(cls) -> None:
         """Update forward references on all fields"""
-        for field in cls.__fields_map__.values():
+        for _, field in cls.__fields_tuple__:
             field.update_forward_refs()
 
     def dict(self) -> dict[str, Any]:
+        # instance field values live in __dict__; class fields live on the class
+        values = self.__dict__
+        class_field_names = self.__class_field_names__
+        if not class_field_names:
+            return {
+                name: values[name] for name in self.__instance_field_names__
+            }
+        cls = type(self)
         return {
-            field_name: getattr(self, field_name)
-            for field_name in self.__fields_map__.keys()
+            name: getattr(cls, name)
+            if name in class_field_names
+            else values[name]
+            for name, _ in cls.__fields_tuple__
         }
 
     @classmethod